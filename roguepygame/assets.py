@@ -8,6 +8,11 @@ BUTTON_REGULAR_IMAGE = 'Button.png'
 BUTTON_HOVERED_IMAGE = 'ButtonHovered.png'
 BUTTON_INACTIVE_IMAGE = 'ButtonInactive.png'
 
+# Image groups, loaded from the disk the first time they are requested
+IMAGES: dict[str, list[str]] = {
+    "BUTTON": [BUTTON_REGULAR_IMAGE, BUTTON_HOVERED_IMAGE, BUTTON_INACTIVE_IMAGE],
+}
+
 
 def load_image(image_name: str, transparent_color: pygame.Color=None, alpha: int=None) -> pygame.Surface:
     """
@@ -31,15 +36,24 @@ class Assets:
     """
     def __init__(self):
         self.images: dict[str, list[pygame.Surface]] = {}
+        self.fonts: dict[int, pygame.font.Font] = {}
 
     def load(self) -> None:
         """
-        Loads the images from the disk
+        Loads all the images from the disk.
+        Images are loaded on first use anyway, this is only needed to avoid loading them mid-game.
         :return: None
         """
-        self.images["BUTTON"] = [load_image(BUTTON_REGULAR_IMAGE),
-                                 load_image(BUTTON_HOVERED_IMAGE),
-                                 load_image(BUTTON_INACTIVE_IMAGE)]
+        for name in IMAGES:
+            self.load_images(name)
+
+    def load_images(self, name: str) -> None:
+        """
+        Loads the group of images from the disk
+        :param name: name of the images
+        :return: None
+        """
+        self.images[name] = [load_image(image_name) for image_name in IMAGES[name]]
 
     def get_image(self, name: str) -> pygame.Surface:
         """
@@ -47,7 +61,7 @@ class Assets:
         :param name: name of the image
         :return: image Surface
         """
-        return self.images[name][0]
+        return self.get_images(name)[0]
 
     def get_images(self, name: str) -> list[pygame.Surface]:
         """
@@ -55,4 +69,19 @@ class Assets:
         :param name: name of the images
         :return: list of image Surface
         """
+        if name not in self.images:
+            self.load_images(name)
         return self.images[name]
+
+    def get_font(self, size: int) -> pygame.font.Font:
+        """
+        Returns the default font of the given size.
+        Font module is initialised and fonts are created on first use.
+        :param size: size of the font
+        :return: font
+        """
+        if size not in self.fonts:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self.fonts[size] = pygame.font.Font(const.FONT_NAME, size)
+        return self.fonts[size]
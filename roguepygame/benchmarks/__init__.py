@@ -0,0 +1,6 @@
+"""
+Benchmarks of the game.
+Run them from the roguepygame folder:
+python -m benchmarks.startup - time from importing the game to the first frame
+python -m benchmarks.frames - frame times of the game loop under synthetic loads
+"""
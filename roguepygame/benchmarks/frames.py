@@ -0,0 +1,143 @@
+"""
+Frame benchmark, runs the game headlessly with the synthetic loads from benchmarks.loads.
+Reports the frame time distribution of every part of the game loop and stores the results as JSON,
+so they can be compared with the results of a previous run.
+Usage: python -m benchmarks.frames [--loads NAME ...] [--amounts N ...] [--frames N] [--output FILE] [--compare FILE]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import time
+from typing import Type
+
+import pygame
+import constants as const
+import game
+import root
+from benchmarks import loads
+
+# Parts of the game loop that are measured
+PHASES = ('events', 'update', 'render', 'flip', 'frame')
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """
+    Returns the distribution of the frame times
+    :param samples: frame times in seconds
+    :return: mean, median, 95th percentile, 99th percentile and max in milliseconds
+    """
+    percentiles = statistics.quantiles(samples, n=100)
+    return {'mean': statistics.fmean(samples) * 1000,
+            'median': statistics.median(samples) * 1000,
+            'p95': percentiles[94] * 1000,
+            'p99': percentiles[98] * 1000,
+            'max': max(samples) * 1000}
+
+
+def frame_count(value: str) -> int:
+    """
+    Argument type of --frames, at least two frames are needed to compute the percentiles
+    :param value: command line value
+    :return: number of frames
+    """
+    frames = int(value)
+    if frames < 2:
+        raise argparse.ArgumentTypeError(f"at least 2 frames are needed, got {frames}")
+    return frames
+
+
+def run_load(program: game.Game, load: Type[root.Scene], amount: int, frames: int, warmup: int) -> dict:
+    """
+    Runs the game with the load and measures every part of the game loop.
+    The loop mirrors Game.step() without the frame rate limit, dt is fixed to 1 / FPS.
+    :param program: Game
+    :param load: scene class creating the load
+    :param amount: size of the load
+    :param frames: number of measured frames
+    :param warmup: number of frames run before measuring
+    :return: frame time distribution of every phase and throughput
+    """
+    random.seed(0)
+    program.get_manager().go_to(load, amount=amount)
+    program.dt = 1 / const.FPS
+    samples: dict[str, list[float]] = {phase: [] for phase in PHASES}
+    for frame in range(warmup + frames):
+        scene = program.get_scene()
+        start = time.perf_counter()
+        scene.update_state()
+        scene.events(pygame.event.get())
+        events = time.perf_counter()
+        scene.update()
+        update = time.perf_counter()
+        scene.render(program.screen)
+        render = time.perf_counter()
+        pygame.display.flip()
+        flip = time.perf_counter()
+        if frame >= warmup:
+            samples['events'].append(events - start)
+            samples['update'].append(update - events)
+            samples['render'].append(render - update)
+            samples['flip'].append(flip - render)
+            samples['frame'].append(flip - start)
+    total = sum(samples['frame'])
+    return {'phases': {phase: summarize(samples[phase]) for phase in PHASES},
+            'fps': frames / total,
+            'items_per_second': amount * frames / total}
+
+
+def compare(results: dict, previous: dict) -> None:
+    """
+    Prints the change of the median frame time of every phase against the previous results
+    :param results: current results
+    :param previous: previous results
+    :return: None
+    """
+    print("\nChange of the median against the previous run:")
+    for load, amounts in results.items():
+        for amount, result in amounts.items():
+            if amount not in previous.get(load, {}):
+                continue
+            changes = []
+            for phase in PHASES:
+                before = previous[load][amount]['phases'][phase]['median']
+                after = result['phases'][phase]['median']
+                changes.append(f"{phase} {(after - before) / before * 100:+6.1f}%" if before else f"{phase}    n/a")
+            print(f"{load:<16} {amount:>6}  " + "  ".join(changes))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--loads', nargs='+', choices=list(loads.LOADS), default=list(loads.LOADS),
+                        help='loads to run')
+    parser.add_argument('--amounts', nargs='+', type=int, default=[10, 100, 1000], help='sizes of the loads')
+    parser.add_argument('--frames', type=frame_count, default=300, help='number of measured frames')
+    parser.add_argument('--warmup', type=int, default=30, help='number of frames run before measuring')
+    parser.add_argument('--output', help='JSON file to store the results in')
+    parser.add_argument('--compare', help='JSON file with the results of a previous run')
+    args = parser.parse_args()
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')  # Headless unless a video driver is chosen
+    program = game.Game()
+    results: dict[str, dict[str, dict]] = {}
+    for load in args.loads:
+        results[load] = {}
+        for amount in args.amounts:
+            result = run_load(program, loads.LOADS[load], amount, args.frames, args.warmup)
+            results[load][str(amount)] = result
+            phases = "  ".join(f"{phase} {result['phases'][phase]['median']:7.3f}" for phase in PHASES)
+            print(f"{load:<16} {amount:>6}  median ms: {phases}  p99 frame {result['phases']['frame']['p99']:7.3f}"
+                  f"  {result['fps']:8.1f} fps  {result['items_per_second']:10.0f} items/s")
+
+    if args.compare is not None:
+        with open(args.compare) as file:
+            compare(results, json.load(file)['results'])
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump({'benchmark': 'frames', 'pygame': pygame.version.ver, 'frames': args.frames,
+                       'results': results}, file, indent=4)
+
+
+if __name__ == '__main__':
+    main()
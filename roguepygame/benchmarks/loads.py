@@ -0,0 +1,92 @@
+"""
+Scenes used by the frame benchmark.
+Every scene is a variant of a game scene that creates `amount` objects stressing one part of the game.
+"""
+import random
+from typing import Type
+
+import pygame
+import constants as const
+import root
+import scenes
+import ui
+import objects
+
+
+class RandomObjectLoad(scenes.GameScene):
+    """
+    GameScene that keeps `amount` RandomObjects moving on the screen
+    """
+    def __init__(self, amount: int = 100, **kwargs):
+        super().__init__(**kwargs)
+        self.timer.stop_timer()
+        self.amount: int = amount
+        self.scene_objects: int = len(self.object_manager.objects)
+
+    def update(self) -> None:
+        for _ in range(self.amount - (len(self.object_manager.objects) - self.scene_objects)):
+            obj = objects.RandomObject()
+            obj.pos.update(random.randrange(const.WIDTH), random.randrange(const.HEIGHT))
+            obj.rect.topleft = (round(obj.pos.x), round(obj.pos.y))
+            obj.add_object()
+        super().update()
+
+
+class ButtonLoad(scenes.MainMenu):
+    """
+    MainMenu with `amount` Buttons, the mouse is moved to a random position every frame
+    """
+    def __init__(self, amount: int = 100, **kwargs):
+        super().__init__(**kwargs)
+        for _ in range(amount):
+            ui.Button("Button", (random.randrange(const.WIDTH), random.randrange(const.HEIGHT)), lambda: None)
+
+    def update_state(self) -> None:
+        self.state['mouse_pos'] = (random.randrange(const.WIDTH), random.randrange(const.HEIGHT))
+        pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=self.state['mouse_pos'], rel=(0, 0),
+                                             buttons=(0, 0, 0)))
+
+
+class TimerLoad(scenes.GameScene):
+    """
+    GameScene with `amount` Timers that fire every frame
+    """
+    def __init__(self, amount: int = 100, **kwargs):
+        super().__init__(**kwargs)
+        self.timer.stop_timer()
+        self.ticks: int = 0
+        for _ in range(amount):
+            root.Timer(0, self.tick).add_object()
+
+    def tick(self) -> None:
+        """
+        Method called by the timers
+        :return: None
+        """
+        self.ticks += 1
+
+
+class TextLoad(scenes.GameScene):
+    """
+    GameScene with `amount` Texts whose text changes every frame
+    """
+    def __init__(self, amount: int = 100, **kwargs):
+        super().__init__(**kwargs)
+        self.timer.stop_timer()
+        self.frame: int = 0
+        self.texts: list[ui.Text] = [ui.Text('', (random.randrange(const.WIDTH), random.randrange(const.HEIGHT)))
+                                     for _ in range(amount)]
+
+    def update(self) -> None:
+        self.frame += 1
+        for index, text in enumerate(self.texts):
+            text.update_text(f'Text {index}: {self.frame}')
+        super().update()
+
+
+LOADS: dict[str, Type[root.Scene]] = {
+    'random_objects': RandomObjectLoad,
+    'buttons': ButtonLoad,
+    'timers': TimerLoad,
+    'texts': TextLoad,
+}
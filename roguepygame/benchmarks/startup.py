@@ -0,0 +1,85 @@
+"""
+Startup benchmark, measures the time from importing the game to the first rendered frame.
+Every run is done in a fresh interpreter, so the import cost is measured as well.
+Usage: python -m benchmarks.startup [--runs N] [--output FILE]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+GAME_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Code run in the fresh interpreter, prints the timings of the startup phases as JSON
+RUN_CODE = """
+import time
+start = time.perf_counter()
+import game
+imported = time.perf_counter()
+g = game.Game()
+initialised = time.perf_counter()
+g.frame()  # Game.step() would also wait for the frame rate limit
+first_frame = time.perf_counter()
+import json
+print(json.dumps({'import': imported - start, 'init': initialised - imported,
+                  'first_frame': first_frame - initialised, 'total': first_frame - start}))
+"""
+
+
+def run_once() -> dict[str, float]:
+    """
+    Starts the game in a new interpreter and returns the timings of the startup phases
+    :return: seconds spent in each startup phase
+    """
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1')
+    result = subprocess.run([sys.executable, '-c', RUN_CODE], cwd=GAME_FOLDER, env=env,
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Startup run failed with exit code {result.returncode}:\n{result.stderr}")
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def run_count(value: str) -> int:
+    """
+    Argument type of --runs, at least one run is needed
+    :param value: command line value
+    :return: number of runs
+    """
+    runs = int(value)
+    if runs < 1:
+        raise argparse.ArgumentTypeError(f"at least 1 run is needed, got {runs}")
+    return runs
+
+
+def run(runs: int) -> dict[str, dict[str, float]]:
+    """
+    Runs the startup benchmark multiple times
+    :param runs: number of runs
+    :return: min, median and max seconds of every startup phase
+    """
+    samples = [run_once() for _ in range(runs)]
+    return {phase: {'min': min(sample[phase] for sample in samples),
+                    'median': statistics.median(sample[phase] for sample in samples),
+                    'max': max(sample[phase] for sample in samples)}
+            for phase in samples[0]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=run_count, default=10, help='number of runs')
+    parser.add_argument('--output', help='JSON file to store the results in')
+    args = parser.parse_args()
+
+    results = run(args.runs)
+    for phase, stats in results.items():
+        print(f"{phase:<12} min {stats['min'] * 1000:8.2f} ms  median {stats['median'] * 1000:8.2f} ms  "
+              f"max {stats['max'] * 1000:8.2f} ms")
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump({'benchmark': 'startup', 'runs': args.runs, 'results': results}, file, indent=4)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,8 @@
 import os
-import sys
 from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from game import Game
 
-import pygame
-
 program: Optional["Game"] = None  # Game class
 
 WIDTH: int = 800
@@ -13,7 +10,21 @@ HEIGHT: int = 600
 SCREEN_SIZE: tuple[int, int] = (WIDTH, HEIGHT)
 FPS: int = 60
 
-FONT_NAME: str = pygame.font.get_default_font()
-FOLDER = os.path.dirname(sys.modules['__main__'].__file__)
+# Folders are resolved relative to this module, so they don't depend on how the game was started
+FOLDER = os.path.dirname(os.path.abspath(__file__))
 ASSETS_FOLDER = os.path.join(FOLDER, 'assets')
 IMAGE_FOLDER = os.path.join(ASSETS_FOLDER, 'images')
+
+
+def __getattr__(name: str):
+    """
+    Resolves the constants that need pygame only when they are first used, so importing constants stays cheap
+    :param name: name of the constant
+    :return: value of the constant
+    """
+    if name == 'FONT_NAME':
+        import pygame
+        global FONT_NAME
+        FONT_NAME = pygame.font.get_default_font()
+        return FONT_NAME
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
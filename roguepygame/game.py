@@ -3,7 +3,6 @@ from typing import Type, Optional
 import pygame
 import constants as const
 import root
-import scenes
 import assets
 
 
@@ -13,19 +12,23 @@ class Game:  # TODO Rename this to the game name later
     If you want to run the game you should create the Game object and call run() method.
     """
 
-    def __init__(self, start_scene: Optional[Type[root.Scene]]=scenes.MainMenu):
+    def __init__(self, start_scene: Optional[Type[root.Scene]]=None):
         """
-        Initialise the game
-        :param start_scene: Scene used at the start
+        Initialise the game.
+        Only the pygame subsystems the game uses are initialised, fonts and images are loaded on first use.
+        :param start_scene: Scene used at the start, MainMenu if None
         """
         const.program = self
-        pygame.init()
+        pygame.display.init()  # Also initialises the event subsystem
         self.screen: pygame.Surface = pygame.display.set_mode(const.SCREEN_SIZE)
         self.clock: pygame.time.Clock = pygame.time.Clock()
+        self.clock.tick()  # Starts the timer subsystem, pygame.time.get_ticks() returns 0 before that
         self.assets: assets.Assets = assets.Assets()
-        self.assets.load()
         self.manager: root.SceneManager = root.SceneManager()
         self.dt: int = 0
+        if start_scene is None:
+            import scenes
+            start_scene = scenes.MainMenu
         self.manager.go_to(start_scene)
 
     def run(self) -> None:
@@ -34,14 +37,28 @@ class Game:  # TODO Rename this to the game name later
         :return: None
         """
         while True:
-            scene = self.get_scene()
-            pygame.display.set_caption(f"{self.clock.get_fps():.2f}")
-            scene.update_state()
-            scene.events(pygame.event.get())
-            scene.update()
-            scene.render(self.screen)
-            pygame.display.flip()
-            self.dt = self.clock.tick(const.FPS) / 1000
+            self.step()
+
+    def step(self) -> None:
+        """
+        Runs one iteration of the game loop
+        :return: None
+        """
+        self.frame()
+        self.dt = self.clock.tick(const.FPS) / 1000
+
+    def frame(self) -> None:
+        """
+        Processes the events, updates and renders one frame, without waiting for the frame rate limit
+        :return: None
+        """
+        scene = self.get_scene()
+        pygame.display.set_caption(f"{self.clock.get_fps():.2f}")
+        scene.update_state()
+        scene.events(pygame.event.get())
+        scene.update()
+        scene.render(self.screen)
+        pygame.display.flip()
 
     def quit(self) -> None:
         """
@@ -57,6 +74,13 @@ class Game:  # TODO Rename this to the game name later
         """
         return self.manager.object_manager
 
+    def get_camera(self) -> root.Camera:
+        """
+        Returns the Camera of the game
+        :return: camera
+        """
+        return self.manager.object_manager.camera
+
     def get_event_manager(self) -> root.EventManager:
         """
         Returns the EventManager of the game
@@ -14,7 +14,7 @@ class RandomObject(root.DrawableObject):  # TODO: Remove, this is just for testi
         self.velocity = pygame.Vector2(300, 0)  # pixels per second
 
     def update(self):
-        self.pos.x += self.program.dt * self.velocity.x
+        self.pos.x += self.dt * self.velocity.x
         self.rect.x = round(self.pos.x)
         if self.rect.left > const.WIDTH:
             self.destroy_object()
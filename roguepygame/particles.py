@@ -0,0 +1,127 @@
+import numpy as np
+import pygame
+import root
+
+
+class ParticleSystem(root.DrawableObject):
+    """
+    Drawable object that simulates a large number of small particles (sparks, blood, spell trails, ...).
+    Instead of being separate GameObjects the particles are stored in NumPy arrays,
+    they are updated all at once and written directly to the pixels of the screen.
+    Alive particles are always kept at the start of the arrays, so only the first `count` entries are used.
+    """
+    def __init__(self, capacity: int = 65536, gravity: tuple[float, float] = (0, 0), size: int = 1,
+                 layer: int = 1):
+        """
+        Initialise the particle system
+        :param capacity: maximum number of particles alive at the same time, new particles over it are dropped
+        :param gravity: acceleration applied to every particle in pixels per second squared
+        :param size: size of the square drawn for every particle in pixels
+        :param layer: layer of the object
+        """
+        super().__init__(layer=layer)
+        self.capacity: int = capacity
+        self.gravity: np.ndarray = np.array(gravity, dtype=np.float32)
+        self.size: int = size
+        self.count: int = 0
+        self.positions: np.ndarray = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocities: np.ndarray = np.zeros((capacity, 2), dtype=np.float32)
+        self.lifetimes: np.ndarray = np.zeros(capacity, dtype=np.float32)
+        self.colors: np.ndarray = np.zeros(capacity, dtype=np.uint32)  # Colors mapped to the screen pixel format
+        self.rect = pygame.Rect(0, 0, 0, 0)
+
+    def emit(self, position: tuple[float, float], amount: int, speed: tuple[float, float] = (50, 150),
+             angle: tuple[float, float] = (0, 360), lifetime: tuple[float, float] = (0.5, 1.0),
+             color: pygame.Color = pygame.Color("WHITE")) -> int:
+        """
+        Method that spawns new particles at the given position.
+        Speed, angle and lifetime of every particle are picked randomly from the given ranges.
+        :param position: position the particles are spawned at
+        :param amount: number of particles to spawn
+        :param speed: range of the particle speed in pixels per second
+        :param angle: range of the particle direction in degrees
+        :param lifetime: range of the particle lifetime in seconds
+        :param color: color of the particles
+        :return: number of particles that were spawned
+        """
+        amount = min(amount, self.capacity - self.count)
+        if amount <= 0:
+            return 0
+        new = slice(self.count, self.count + amount)
+        speeds = np.random.uniform(*speed, amount)
+        angles = np.radians(np.random.uniform(*angle, amount))
+        self.positions[new] = position
+        self.velocities[new, 0] = np.cos(angles) * speeds
+        self.velocities[new, 1] = np.sin(angles) * speeds
+        self.lifetimes[new] = np.random.uniform(*lifetime, amount)
+        self.colors[new] = self.program.screen.map_rgb(color)
+        self.count += amount
+        self.update_rect()  # So the new particles are not culled before the next update
+        return amount
+
+    def clear(self) -> None:
+        """
+        Method that removes all particles
+        :return: None
+        """
+        self.count = 0
+        self.rect.size = (0, 0)
+
+    def update(self) -> None:
+        """
+        Moves the particles and removes the expired ones
+        :return: None
+        """
+        if not self.count:
+            return
+        dt = self.dt
+        alive = slice(0, self.count)
+        self.velocities[alive] += self.gravity * dt
+        self.positions[alive] += self.velocities[alive] * dt
+        self.lifetimes[alive] -= dt
+
+        expired = self.lifetimes[alive] <= 0
+        if expired.any():
+            keep = np.flatnonzero(~expired)
+            self.count = len(keep)
+            for array in (self.positions, self.velocities, self.lifetimes, self.colors):
+                array[:self.count] = array[keep]
+        self.update_rect()
+
+    def update_rect(self) -> None:
+        """
+        Updates the rect to the bounding box of the alive particles
+        :return: None
+        """
+        if not self.count:
+            self.rect.size = (0, 0)
+            return
+        positions = self.positions[:self.count]
+        left, top = np.floor(positions.min(axis=0))
+        right, bottom = np.floor(positions.max(axis=0))
+        self.rect.update(int(left), int(top), int(right - left) + self.size, int(bottom - top) + self.size)
+
+    def render(self, screen: pygame.Surface, offset: tuple[int, int] = (0, 0)) -> None:
+        """
+        Method that writes the particles directly to the pixels of the game window.
+        Particles outside the window are skipped.
+        :param screen: game window, must not be a 24-bit Surface
+        :param offset: offset converting the particle positions to screen coordinates
+        :return: None
+        """
+        if not self.count:
+            return
+        positions = np.floor(self.positions[:self.count]).astype(np.int32)
+        if offset != (0, 0):
+            positions += offset
+        width, height = screen.get_size()
+        visible = ((positions[:, 0] >= 0) & (positions[:, 0] <= width - self.size) &
+                   (positions[:, 1] >= 0) & (positions[:, 1] <= height - self.size))
+        xs, ys = positions[visible, 0], positions[visible, 1]
+        colors = self.colors[:self.count][visible]
+
+        pixels = pygame.surfarray.pixels2d(screen)
+        for dx in range(self.size):
+            for dy in range(self.size):
+                pixels[xs + dx, ys + dy] = colors
+        del pixels  # Unlocks the screen
@@ -1,3 +1,5 @@
+import bisect
+import heapq
 from typing import Optional, Type, Any, Callable, TYPE_CHECKING, Protocol
 
 import pygame
@@ -108,12 +110,24 @@ class ObjectManager:
     It contains the collection of all the active objects in the scene.
     It supports creating and destroying the objects.
     It gives the ability to iterate over all objects and call important methods.
+    Only the DrawableObjects visible by the Camera are rendered.
+    Static DrawableObjects are kept in a SpatialGrid, so the ones outside the camera are not checked at all.
+    Objects are kept sorted by the layer and the order of adding, so the layer must not change after adding.
     You shouldn't create the instance of this object, but rather use the object already created in the Game class.
     """
     def __init__(self):
         self.program: game.Game = const.program
         self.objects: list[GameObject] = []
+        self.object_keys: list[tuple[int, int]] = []  # Sort keys of the objects
+        self.drawables: list[DrawableObject] = []  # DrawableObjects that are not in the static_index
+        self.drawable_keys: list[tuple[int, int]] = []  # Sort keys of the drawables
+        self.static_index: SpatialGrid = SpatialGrid()
         self.event_manager: EventManager = EventManager()
+        self.camera: Camera = Camera()
+        self.offscreen: set[DrawableObject] = set()  # Drawables culled in the last frame
+        self.visible_static: set[DrawableObject] = set()  # Static objects visible in the last frame
+        self.frame: int = 0
+        self.added_objects: int = 0
 
     def object_events(self, events: list[pygame.event.Event]) -> None:
         """
@@ -125,21 +139,56 @@ class ObjectManager:
 
     def object_update(self) -> None:
         """
-        Method used to call the update() method of all objects
+        Method used to call the update() method of all objects.
+        Objects that were culled in the last frame are updated only every offscreen_update_interval frames.
         :return: None
         """
+        self.frame += 1
+        dt = self.program.dt
         for obj in self.objects:
+            if obj.offscreen_update_interval > 1 and self.is_offscreen(obj):
+                if (self.frame + obj.order) % obj.offscreen_update_interval:
+                    obj.skipped_time += dt
+                    continue
+            obj.dt = dt + obj.skipped_time
+            obj.skipped_time = 0
             obj.update()
 
     def object_render(self, screen: pygame.Surface) -> None:
         """
-        Method used to call the render() method of all DrawableObjects
+        Method used to call the render() method of all DrawableObjects visible by the camera.
+        Objects are drawn in the layer order.
+        Screen space objects and objects without a rect are never culled.
         :param screen: game window
         :return: None
         """
-        for obj in self.objects:
-            if isinstance(obj, DrawableObject):
+        view = self.camera.rect
+        offset = self.camera.get_offset()
+        offscreen = self.offscreen
+        offscreen.clear()
+        self.visible_static = self.static_index.query(view)
+        drawables = self.drawables
+        if self.visible_static:
+            drawables = heapq.merge(sorted(self.visible_static, key=render_sort_key), drawables,
+                                    key=render_sort_key)
+        for obj in drawables:
+            if obj.screen_space:
                 obj.render(screen)
+            elif obj.rect is None or view.colliderect(obj.rect):
+                obj.render(screen, offset)
+            else:
+                offscreen.add(obj)
+
+    def is_offscreen(self, obj: "GameObject") -> bool:
+        """
+        Returns whether the object was culled in the last frame.
+        Objects that haven't been rendered yet are not offscreen.
+        :param obj: GameObject
+        :return: true if the object was culled
+        """
+        if obj in self.static_index:
+            return obj not in self.visible_static
+        return obj in self.offscreen
 
     def add_object(self, obj: "GameObject") -> None:
         """
@@ -147,8 +196,14 @@ class ObjectManager:
         :param obj: GameObject you want to add
         :return: None
         """
-        self.objects.append(obj)
-        self.objects.sort(key=layer_sort_key)
+        self.added_objects += 1
+        obj.order = self.added_objects
+        insert_sorted(self.objects, self.object_keys, obj)
+        if isinstance(obj, DrawableObject):
+            if obj.static and not obj.screen_space and obj.rect is not None:
+                self.static_index.insert(obj)
+            else:
+                insert_sorted(self.drawables, self.drawable_keys, obj)
 
     def remove_object(self, obj: "GameObject") -> None:
         """
@@ -157,7 +212,14 @@ class ObjectManager:
         :return: None
         """
         self.event_manager.remove_object(obj)
-        self.objects.remove(obj)
+        remove_sorted(self.objects, self.object_keys, obj)
+        if isinstance(obj, DrawableObject):
+            if obj in self.static_index:
+                self.static_index.remove(obj)
+                self.visible_static.discard(obj)
+            else:
+                remove_sorted(self.drawables, self.drawable_keys, obj)
+                self.offscreen.discard(obj)
 
     def clear_objects(self) -> None:
         """
@@ -167,6 +229,117 @@ class ObjectManager:
         copy_of_objects = self.objects.copy()
         for obj in copy_of_objects:
             self.remove_object(obj)
+        self.camera.rect.topleft = (0, 0)
+
+
+class Camera:
+    """
+    Class used to represent the part of the world visible in the game window.
+    Objects are positioned in world coordinates, the camera converts them to screen coordinates.
+    """
+    def __init__(self, size: tuple[int, int] = const.SCREEN_SIZE):
+        self.rect: pygame.Rect = pygame.Rect((0, 0), size)  # Visible area in world coordinates
+
+    def move(self, dx: int, dy: int) -> None:
+        """
+        Moves the camera
+        :param dx: distance to move on the x axis
+        :param dy: distance to move on the y axis
+        :return: None
+        """
+        self.rect.move_ip(dx, dy)
+
+    def center_on(self, position: tuple[int, int]) -> None:
+        """
+        Centers the camera on the position
+        :param position: position in world coordinates
+        :return: None
+        """
+        self.rect.center = position
+
+    def get_offset(self) -> tuple[int, int]:
+        """
+        Returns the offset that converts the world coordinates to screen coordinates
+        :return: offset
+        """
+        return -self.rect.x, -self.rect.y
+
+    def world_to_screen(self, position: tuple[int, int]) -> tuple[int, int]:
+        """
+        Converts the world coordinates to screen coordinates
+        :param position: position in world coordinates
+        :return: position in screen coordinates
+        """
+        return position[0] - self.rect.x, position[1] - self.rect.y
+
+    def screen_to_world(self, position: tuple[int, int]) -> tuple[int, int]:
+        """
+        Converts the screen coordinates to world coordinates
+        :param position: position in screen coordinates
+        :return: position in world coordinates
+        """
+        return position[0] + self.rect.x, position[1] + self.rect.y
+
+
+class SpatialGrid:
+    """
+    Class used to quickly find the static objects whose rect collides with an area.
+    The world is split into square cells and every object is stored in the cells its rect covers.
+    The rect of the object is stored when it's inserted, objects that move must be removed and inserted again.
+    """
+    def __init__(self, cell_size: int = 256):
+        self.cell_size: int = cell_size
+        self.cells: dict[tuple[int, int], set[DrawableObject]] = {}
+        self.object_rects: dict[DrawableObject, pygame.Rect] = {}
+
+    def __contains__(self, obj: "GameObject") -> bool:
+        return obj in self.object_rects
+
+    def get_cells(self, rect: pygame.Rect) -> list[tuple[int, int]]:
+        """
+        Returns the cells the rect covers
+        :param rect: rect in world coordinates
+        :return: list of cell keys
+        """
+        right = rect.left + max(rect.width, 1) - 1
+        bottom = rect.top + max(rect.height, 1) - 1
+        return [(column, row)
+                for column in range(rect.left // self.cell_size, right // self.cell_size + 1)
+                for row in range(rect.top // self.cell_size, bottom // self.cell_size + 1)]
+
+    def insert(self, obj: "DrawableObject") -> None:
+        """
+        Method that adds the object to the grid
+        :param obj: DrawableObject to add
+        :return: None
+        """
+        rect = obj.rect.copy()
+        self.object_rects[obj] = rect
+        for cell in self.get_cells(rect):
+            self.cells.setdefault(cell, set()).add(obj)
+
+    def remove(self, obj: "DrawableObject") -> None:
+        """
+        Method that removes the object from the grid
+        :param obj: DrawableObject to remove
+        :return: None
+        """
+        for cell in self.get_cells(self.object_rects.pop(obj)):
+            self.cells[cell].discard(obj)
+            if not self.cells[cell]:
+                del self.cells[cell]
+
+    def query(self, rect: pygame.Rect) -> set["DrawableObject"]:
+        """
+        Returns the objects whose rect collides with the area
+        :param rect: area in world coordinates
+        :return: set of colliding objects
+        """
+        found = set()
+        for cell in self.get_cells(rect):
+            if cell in self.cells:
+                found.update(self.cells[cell])
+        return {obj for obj in found if rect.colliderect(self.object_rects[obj])}
 
 
 class EventManager:
@@ -230,6 +403,10 @@ class GameObject:
         self.program: game.Game = const.program
         self.name: Optional[str] = None
         self.child_objects: dict[str, GameObject] = {}
+        self.dt: float = 0  # Seconds since the last update of this object
+        self.offscreen_update_interval: int = 1  # Update every n-th frame while not visible
+        self.order: int = 0  # Order of adding to the ObjectManager, also spreads the offscreen updates over frames
+        self.skipped_time: float = 0
 
     def add_child(self, child_obj: "GameObject", child_name: Optional[str] = None) -> None:
         """
@@ -278,6 +455,9 @@ class DrawableObject(GameObject):
     """
     Class used to represent the object that is drawn on the Scene
     Requires image and rect attributes
+    Rect is in world coordinates, or in screen coordinates if screen_space is set (UI elements)
+    Objects whose rect doesn't change after adding (walls, floor, items) should set static,
+    so they are found through the spatial index instead of being checked every frame.
     """
 
     def __init__(self, image: pygame.Surface = None, rect: pygame.Rect = None, layer: int = 1):
@@ -285,15 +465,18 @@ class DrawableObject(GameObject):
         self.image = image
         self.rect = rect
         self.layer = layer
+        self.screen_space: bool = False
+        self.static: bool = False
 
-    def render(self, screen: pygame.Surface) -> None:
+    def render(self, screen: pygame.Surface, offset: tuple[int, int] = (0, 0)) -> None:
         """
         Method that draws the object to the game window.
         :param screen: game window
+        :param offset: offset converting the rect to screen coordinates
         :return: None
         """
         if self.image is not None and self.rect is not None:
-            screen.blit(self.image, self.rect)
+            screen.blit(self.image, self.rect.move(offset) if offset != (0, 0) else self.rect)
 
 
 class ClickableObject(DrawableObject):
@@ -312,7 +495,8 @@ class ClickableObject(DrawableObject):
         :return: None
         """
         if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.rect.collidepoint(event.pos):
+            pos = event.pos if self.screen_space else self.program.get_camera().screen_to_world(event.pos)
+            if self.rect.collidepoint(pos):
                 if event.button == 1:
                     self.click_function()
                 if event.button == 3:
@@ -392,4 +576,42 @@ def layer_sort_key(x: GameObject) -> int:
     :param x: GameObject
     :return: GameObject layer
     """
-    return x.layer if hasattr(x, 'layer') else 0
\ No newline at end of file
+    return x.layer if hasattr(x, 'layer') else 0
+
+
+def render_sort_key(x: GameObject) -> tuple[int, int]:
+    """
+    Function used to return layer and order of adding for sorting
+    :param x: GameObject
+    :return: GameObject layer and order
+    """
+    return layer_sort_key(x), x.order
+
+
+def insert_sorted(objects: list, keys: list[tuple[int, int]], obj: GameObject) -> None:
+    """
+    Function used to insert the object to the list sorted by render_sort_key
+    :param objects: sorted list of objects
+    :param keys: sort keys of the objects
+    :param obj: object to insert
+    :return: None
+    """
+    key = render_sort_key(obj)
+    index = bisect.bisect(keys, key)
+    keys.insert(index, key)
+    objects.insert(index, obj)
+
+
+def remove_sorted(objects: list, keys: list[tuple[int, int]], obj: GameObject) -> None:
+    """
+    Function used to remove the object from the list sorted by render_sort_key
+    :param objects: sorted list of objects
+    :param keys: sort keys of the objects
+    :param obj: object to remove
+    :return: None
+    """
+    index = bisect.bisect_left(keys, render_sort_key(obj))
+    if index == len(objects) or objects[index] is not obj:
+        index = objects.index(obj)  # The layer has changed after adding
+    del keys[index]
+    del objects[index]
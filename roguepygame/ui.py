@@ -1,7 +1,7 @@
-from typing import Callable
+from collections import deque
+from typing import Callable, Optional
 
 import pygame
-import constants as const
 import root
 from enums import ButtonStates
 
@@ -14,12 +14,13 @@ class Text(root.DrawableObject):
                  color: pygame.Color = pygame.Color("BLACK"), allign: str = "center",
                  create_object=True):
         super().__init__()
+        self.screen_space = True
         self.text: str = text
         self.position: tuple[int, int] = position
         self.size: int = size
         self.color: pygame.Color = color
         self.allign: str = allign
-        self.font: pygame.font.Font = pygame.font.Font(const.FONT_NAME, size)
+        self.font: pygame.font.Font = self.program.get_assets().get_font(size)
         self.create_surface()
         if create_object:
             self.add_object()
@@ -49,6 +50,7 @@ class Button(root.ClickableObject):
     """
     def __init__(self, text: str, position: tuple[int, int], do: Callable, active: bool=True):
         super().__init__()
+        self.screen_space = True
         self.state: ButtonStates = ButtonStates.ACTIVE if active else ButtonStates.INACTIVE
         self.images = self.program.assets.get_images('BUTTON')
         self.image = self.images[self.state.value]
@@ -109,3 +111,134 @@ class Button(root.ClickableObject):
         """
         if self.state != ButtonStates.INACTIVE:
             self.do()
+
+
+class MessageLog(root.DrawableObject):
+    """
+    Scrolling message log element class (combat log etc.)
+    Keeps the last max_messages messages, the oldest ones are dropped.
+    Every message is rendered only once, the visible lines are composed into a single Surface
+    that is scrolled when new messages arrive, so only the newly shown lines have to be drawn.
+    """
+    def __init__(self, position: tuple[int, int], size: tuple[int, int], max_messages: int = 100,
+                 font_size: int = 20, color: pygame.Color = pygame.Color("BLACK"),
+                 background: Optional[pygame.Color] = None, allign: str = "topleft", create_object=True):
+        """
+        Initialise the message log
+        :param position: position of the log
+        :param size: size of the log, the height is split into lines of the font line size
+        :param max_messages: number of messages kept in the log
+        :param font_size: size of the font
+        :param color: default color of the messages
+        :param background: background color of the log, transparent if None
+        :param allign: which point of the log is placed at the position
+        :param create_object: whether to add the log to the ObjectManager
+        """
+        super().__init__()
+        self.screen_space = True
+        self.messages: deque[tuple[str, pygame.Surface]] = deque(maxlen=max_messages)
+        self.color: pygame.Color = color
+        self.background: pygame.Color = background if background is not None else pygame.Color(0, 0, 0, 0)
+        self.font: pygame.font.Font = self.program.get_assets().get_font(font_size)
+        self.line_height: int = self.font.get_linesize()
+        self.visible_lines: int = max(1, size[1] // self.line_height)
+        self.offset: int = 0  # Number of lines scrolled back from the newest message
+        self.image = pygame.Surface(size, pygame.SRCALPHA)
+        self.image.fill(self.background)
+        self.rect = self.image.get_rect(**{allign: position})
+        self.program.get_event_manager().subscribe(pygame.MOUSEWHEEL, self)
+        if create_object:
+            self.add_object()
+
+    def add_message(self, text: str, color: Optional[pygame.Color] = None) -> None:
+        """
+        Adds the message to the end of the log
+        :param text: text of the message
+        :param color: color of the message, color of the log if None
+        :return: None
+        """
+        surface = self.font.render(text, True, color if color is not None else self.color)
+        dropped = len(self.messages) == self.messages.maxlen  # Appending drops the oldest message
+        self.messages.append((text, surface))
+        last_line = min(len(self.messages), self.visible_lines) - 1
+        if self.offset:
+            # Log is scrolled back, keep the same messages in the view
+            self.offset += 1
+            if self.offset > self.max_offset():
+                self.offset = self.max_offset()
+                self.draw_lines(range(self.visible_lines))
+        elif len(self.messages) <= self.visible_lines and not dropped:
+            self.draw_lines(range(last_line, last_line + 1))
+        else:
+            self.image.scroll(0, -self.line_height)
+            self.draw_lines(range(last_line, last_line + 1))
+
+    def scroll(self, lines: int) -> None:
+        """
+        Scrolls the log
+        :param lines: number of lines to scroll, positive values scroll to the older messages
+        :return: None
+        """
+        offset = max(0, min(self.offset + lines, self.max_offset()))
+        delta = offset - self.offset
+        if not delta:
+            return
+        self.offset = offset
+        if abs(delta) >= self.visible_lines:
+            self.draw_lines(range(self.visible_lines))
+        else:
+            self.image.scroll(0, delta * self.line_height)
+            if delta > 0:
+                self.draw_lines(range(delta))
+                # Clear the part of the last line moved below the visible lines
+                bottom = self.visible_lines * self.line_height
+                self.image.fill(self.background, (0, bottom, self.rect.width, self.rect.height - bottom))
+            else:
+                self.draw_lines(range(self.visible_lines + delta, self.visible_lines))
+
+    def scroll_to_bottom(self) -> None:
+        """
+        Scrolls the log to the newest message
+        :return: None
+        """
+        self.scroll(-self.offset)
+
+    def clear(self) -> None:
+        """
+        Removes all messages from the log
+        :return: None
+        """
+        self.messages.clear()
+        self.offset = 0
+        self.image.fill(self.background)
+
+    def max_offset(self) -> int:
+        """
+        Returns how many lines the log can be scrolled back
+        :return: maximum offset
+        """
+        return max(0, len(self.messages) - self.visible_lines)
+
+    def draw_lines(self, lines: range) -> None:
+        """
+        Draws the already rendered messages to the given visible lines of the log
+        :param lines: indices of the visible lines, 0 is the top line
+        :return: None
+        """
+        first_message = max(0, len(self.messages) - self.visible_lines - self.offset)
+        last_message = len(self.messages) - self.offset
+        for line in lines:
+            y = line * self.line_height
+            self.image.fill(self.background, (0, y, self.rect.width, self.line_height))
+            if first_message + line < last_message:
+                self.image.blit(self.messages[first_message + line][1], (0, y))
+
+    def events(self, event: pygame.event.Event) -> None:
+        """
+        Scrolls the log with the mouse wheel when the mouse is over it
+        :param event: Relevant event
+        :return: None
+        """
+        if event.type == pygame.MOUSEWHEEL:
+            if self.rect.collidepoint(self.program.get_scene().state['mouse_pos']):
+                self.scroll(event.y)
@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+# The game modules import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'roguepygame'))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+
+@pytest.fixture
+def program():
+    """
+    Headless game with an empty scene
+    """
+    import root
+    import game
+
+    class EmptyScene(root.Scene):
+        def update(self) -> None:
+            self.object_manager.object_update()
+
+        def render(self, screen) -> None:
+            self.object_manager.object_render(screen)
+
+    return game.Game(EmptyScene)
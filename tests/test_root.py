@@ -0,0 +1,74 @@
+import random
+
+import pygame
+import root
+
+
+class RecordingObject(root.DrawableObject):
+    """
+    DrawableObject that records the order it was rendered in
+    """
+    rendered: list["RecordingObject"] = []
+
+    def render(self, screen: pygame.Surface, offset: tuple[int, int] = (0, 0)) -> None:
+        RecordingObject.rendered.append(self)
+
+
+def render(program) -> list[RecordingObject]:
+    RecordingObject.rendered = []
+    program.get_object_manager().object_render(program.screen)
+    return RecordingObject.rendered
+
+
+def test_render_culls_static_and_moving_objects(program):
+    rng = random.Random(0)
+    camera = program.get_camera()
+    objects = []
+    for index in range(500):
+        obj = RecordingObject(rect=pygame.Rect(rng.randint(-2000, 2000), rng.randint(-2000, 2000), 40, 40),
+                              layer=rng.randint(0, 3))
+        obj.static = index % 2 == 0
+        objects.append(obj.add_object())
+    for _ in range(50):
+        for obj in rng.sample(objects, 20):
+            if not obj.static:
+                obj.rect.move_ip(rng.randint(-100, 100), rng.randint(-100, 100))
+        camera.move(rng.randint(-200, 200), rng.randint(-200, 200))
+        expected = [obj for obj in program.get_object_manager().objects if camera.rect.colliderect(obj.rect)]
+        assert render(program) == expected
+
+
+def test_render_keeps_layer_order_between_world_and_screen_objects(program):
+    ui_element = RecordingObject(rect=pygame.Rect(0, 0, 10, 10), layer=1)
+    ui_element.screen_space = True
+    ui_element.add_object()
+    wall = RecordingObject(rect=pygame.Rect(0, 0, 10, 10), layer=5)
+    wall.static = True
+    wall.add_object()
+    unit = RecordingObject(rect=pygame.Rect(0, 0, 10, 10), layer=3).add_object()
+    assert render(program) == [ui_element, unit, wall]
+
+
+def test_render_never_culls_objects_without_rect(program):
+    background = RecordingObject(layer=0).add_object()
+    program.get_camera().move(10000, 10000)
+    assert render(program) == [background]
+
+
+def test_new_objects_are_not_throttled_before_rendering(program):
+    object_manager = program.get_object_manager()
+    program.get_camera().move(10000, 10000)
+
+    class Counter(root.DrawableObject):
+        updates = 0
+
+        def update(self) -> None:
+            self.updates += 1
+
+    counter = Counter(rect=pygame.Rect(0, 0, 10, 10))
+    counter.offscreen_update_interval = 1000
+    counter.add_object()
+    object_manager.object_update()
+    assert counter.updates == 1
+    object_manager.object_render(program.screen)
+    assert object_manager.is_offscreen(counter)
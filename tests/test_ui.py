@@ -0,0 +1,40 @@
+import random
+
+import pygame
+import pytest
+import ui
+
+
+def assert_matches_full_redraw(log: ui.MessageLog) -> None:
+    """
+    Checks that the incrementally composed log looks the same as the log drawn from scratch
+    """
+    composed = pygame.image.tobytes(log.image, 'RGBA')
+    log.image.fill(log.background)
+    log.draw_lines(range(log.visible_lines))
+    assert composed == pygame.image.tobytes(log.image, 'RGBA')
+
+
+@pytest.mark.parametrize('max_messages', [2, 3, 4, 20])
+@pytest.mark.parametrize('size', [(300, 100), (300, 132)])
+@pytest.mark.parametrize('background', [None, pygame.Color("WHITE")])
+def test_message_log_matches_full_redraw(program, max_messages, size, background):
+    log = ui.MessageLog((0, 0), size, max_messages=max_messages, background=background)
+    rng = random.Random(0)
+    for index in range(500):
+        choice = rng.random()
+        if choice < 0.6:
+            log.add_message(f"Message {index}")
+        elif choice < 0.95:
+            log.scroll(rng.randint(-8, 8))
+        else:
+            log.clear()
+        assert_matches_full_redraw(log)
+
+
+def test_message_log_drops_oldest_messages(program):
+    log = ui.MessageLog((0, 0), (300, 300), max_messages=3)
+    for index in range(6):
+        log.add_message(f"Message {index}")
+    assert [text for text, surface in log.messages] == ["Message 3", "Message 4", "Message 5"]
+    assert_matches_full_redraw(log)